@@ -1,31 +1,66 @@
 import sys
 import os
 import re
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import requests
-import urllib.parse
-from urllib.parse import urljoin, unquote, urlparse
-from bs4 import BeautifulSoup
-from collections import deque
+from requests.adapters import HTTPAdapter
+from urllib.parse import urljoin, unquote
+from lxml import html as lxml_html
+from lxml.etree import ParserError
 
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLineEdit,
-    QPushButton, QTableWidget, QTableWidgetItem, QProgressBar,
-    QLabel, QFileDialog, QCheckBox, QHeaderView, QMenu, QSpinBox
+    QPushButton, QTableView, QLabel, QFileDialog, QCheckBox, QHeaderView,
+    QMenu, QSpinBox, QStyle, QStyledItemDelegate, QStyleOptionProgressBar
+)
+from PyQt6.QtCore import (
+    Qt, QTimer, QObject, QRunnable, QThreadPool, QAbstractTableModel,
+    QModelIndex, pyqtSignal
 )
-from PyQt6.QtCore import Qt, QTimer, QThread, pyqtSignal
 
 # We only want audio links with these extensions
 AUDIO_EXTENSIONS = [".mp3", ".wav", ".flac", ".ogg", ".m4a", ".aac"]
 
 # If we see a link that ends in ".mp3download", etc., we rename to ".mp3", etc.
-DOWNLOAD_SUFFIX_MAP = {
-    ".mp3download":  ".mp3",
-    ".flacdownload": ".flac",
-    ".wavdownload":  ".wav",
-    ".oggdownload":  ".ogg",
-    ".m4adownload":  ".m4a",
-    ".aacdownload":  ".aac",
-}
+DOWNLOAD_SUFFIXES = tuple(ext + "download" for ext in AUDIO_EXTENSIONS)
+
+# Matches a trailing ".mp3download" etc. and captures the real extension
+_DL_FIX_RE = re.compile(
+    r"(\.(?:%s))download\Z" % "|".join(re.escape(ext[1:]) for ext in AUDIO_EXTENSIONS),
+    re.IGNORECASE,
+)
+
+# File-name characters Windows won't accept, as a str.translate() deletion table
+_FORBIDDEN_TABLE = str.maketrans('', '', '\\/*?:"<>|')
+
+# Every suffix we accept, as a tuple so one str.endswith() call checks them all
+ALL_AUDIO_SUFFIXES = tuple(AUDIO_EXTENSIONS) + DOWNLOAD_SUFFIXES
+
+# Read downloads in 1 MiB chunks; small chunks make the Python loop the bottleneck
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# Minimum seconds between progress signals sent to the GUI (~10 Hz)
+PROGRESS_EMIT_INTERVAL = 0.1
+
+# (connect, read) timeouts in seconds for download requests, so a stalled
+# connection errors out instead of blocking the job (and app exit) forever
+DOWNLOAD_TIMEOUT = (10, 30)
+
+# Files larger than this are fetched as several parallel byte ranges
+# (when the server supports Range), so one file isn't capped by one TCP stream
+RANGED_DOWNLOAD_MIN_SIZE = 8 << 20
+RANGED_DOWNLOAD_SEGMENTS = 4
+
+# "Content-Range: bytes <first>-<last>/<total>" of a 206 reply
+_CONTENT_RANGE_RE = re.compile(r"bytes (\d+)-(\d+)/(\d+)\Z")
+
+# Upper bound of the Max Concurrency spinbox
+MAX_CONCURRENT_DOWNLOADS = 50
+
+# Seconds a scraped page's links are reused without asking the server again
+SCRAPE_CACHE_TTL = 2.0
 
 def sanitize_title(title: str) -> str:
     """
@@ -34,7 +69,7 @@ def sanitize_title(title: str) -> str:
     3) Convert to Title Case (so each word starts with a capital letter).
     """
     # Remove forbidden characters
-    title = re.sub(r'[\\/*?:"<>|]+', '', title)
+    title = title.translate(_FORBIDDEN_TABLE)
     # Trim whitespace
     title = title.strip()
     # Title-case: "absolum - live @ fest" -> "Absolum - Live @ Fest"
@@ -42,46 +77,440 @@ def sanitize_title(title: str) -> str:
 
     return title
 
-class DownloadThread(QThread):
+def preallocate(f, size):
+    """
+    Reserve `size` bytes for the open file `f` up front so the write loop
+    doesn't keep growing (and fragmenting) it. Uses posix_fallocate where the
+    OS has it; elsewhere, or if the filesystem refuses, just sets the length.
+    """
+    if hasattr(os, "posix_fallocate"):
+        try:
+            os.posix_fallocate(f.fileno(), 0, size)
+            return
+        except OSError:
+            pass
+    f.truncate(size)
+
+def scrape_audio_links(session, url, page_cache):
+    """
+    Return a list of (absolute_url, final_title).
+    final_title is the anchor text if available, else fallback to basename.
+    Then we strip the trailing 'download' from .mp3download, .flacdownload, etc.
+    And we pass the result through 'sanitize_title()' (which does Title Case).
+    page_cache maps url -> (etag, last_modified, pairs) for conditional GETs;
+    if the server says the page is unchanged (304), the cached list is returned.
+    Raises requests.exceptions.RequestException if the page can't be fetched.
+    """
+    headers = {}
+    cached = page_cache.get(url)
+    if cached:
+        etag, last_modified, _ = cached
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+    resp = session.get(url, headers=headers, timeout=10)
+    resp.raise_for_status()
+
+    if resp.status_code == 304 and cached:
+        return cached[2]
+
+    # Hand lxml the raw bytes; if the Content-Type header names a charset,
+    # use it (the page may not repeat it in a <meta> tag), else let lxml detect it
+    parser = None
+    if "charset=" in resp.headers.get("content-type", "").lower():
+        parser = lxml_html.HTMLParser(encoding=resp.encoding)
+    try:
+        doc = lxml_html.fromstring(resp.content, parser=parser)
+    except ParserError:
+        return []
+    # Resolve relative links the way a browser would: against the final
+    # (post-redirect) page URL. Local aliases save a global lookup per anchor.
+    base_url = resp.url
+    _urljoin = urljoin
+    _unquote = unquote
+
+    found = []
+    # Item pages often link the same file more than once (player + download)
+    seen = set()
+    for a in doc.iter("a"):
+        # urljoin drops surrounding whitespace, so "x.mp3\n" is still a file
+        href = (a.get("href") or "").strip()
+        # In-page anchors and script links never point at a file
+        if not href or href.startswith(("#", "javascript:")):
+            continue
+
+        # Filter out only known audio
+        # We'll consider either the normal .mp3 or the .mp3download etc.
+        # Test the (stripped) href before joining so non-audio links skip urljoin
+        if not href.lower().endswith(ALL_AUDIO_SUFFIXES):
+            continue
+        absolute_url = _urljoin(base_url, href)
+        if absolute_url in seen:
+            continue
+        seen.add(absolute_url)
+
+        # Strip each text node and join with no separator, like BeautifulSoup's
+        # get_text(strip=True): "Foo.mp3 <span>download</span>" -> "Foo.mp3download"
+        anchor_text = "".join(t.strip() for t in a.itertext())
+        anchor_text = _unquote(anchor_text)
+        if anchor_text:
+            raw_title = anchor_text
+        else:
+            # Last path segment, without any query string or fragment
+            path = absolute_url.split("#", 1)[0].split("?", 1)[0]
+            raw_title = _unquote(path.rsplit("/", 1)[-1])
+
+        if not raw_title:
+            raw_title = "unnamed_file"
+
+        # If the extension ends with .mp3download or .flacdownload, fix it:
+        raw_title = _DL_FIX_RE.sub(lambda m: m.group(1).lower(), raw_title)
+
+        final_title = sanitize_title(raw_title)
+        found.append((absolute_url, final_title))
+
+    etag = resp.headers.get("ETag")
+    last_modified = resp.headers.get("Last-Modified")
+    if etag or last_modified:
+        page_cache[url] = (etag, last_modified, found)
+    else:
+        page_cache.pop(url, None)
+    return found
+
+class DownloadSignals(QObject):
+    # QRunnable is not a QObject, so its signals live on this helper
     progress_update = pyqtSignal(int, int)   # (row, progress%)
     status_update = pyqtSignal(int, str)     # (row, status)
+    finished = pyqtSignal(int)               # (row)
 
-    def __init__(self, row, url, save_path):
+class DownloadJob(QRunnable):
+    def __init__(self, row, url, session, save_path_for):
         super().__init__()
         self.row = row
         self.url = url
-        self.save_path = save_path
-        self.running = True
+        self.session = session
+        # Called when the job actually starts, so a folder change or file
+        # rename made while the row waits in the queue is still honoured
+        self.save_path_for = save_path_for
+        self.save_path = None
+        self.signals = DownloadSignals()
+        # Set from the GUI thread on Pause/Cancel, checked between chunks
+        self.cancel_event = threading.Event()
+        self._last_emit_pct = -1
+        self._last_emit_time = 0.0
 
     def run(self):
         try:
-            self.status_update.emit(self.row, "Downloading")
-            resp = requests.get(self.url, stream=True)
-            resp.raise_for_status()
+            if self.cancel_event.is_set():
+                return
+            self.save_path = self.save_path_for(self.row)
+            self.signals.status_update.emit(self.row, "Downloading")
+            # Ask for the first byte only: a 206 tells us the file size and
+            # that Range works; a server that ignores Range just sends the file
+            resp = self.session.get(
+                self.url,
+                headers={"Range": "bytes=0-0"},
+                stream=True,
+                timeout=DOWNLOAD_TIMEOUT,
+            )
+
+            # 416 means there is no byte 0 (an empty file): fetch it normally
+            if resp.status_code in (206, 416):
+                # Read the short body so the connection goes back to the pool
+                resp.content
+                # Later requests go straight to where any redirect led
+                # (archive.org sends /download/ links to a storage node)
+                url = resp.url
+                total_size = self.ranged_total_size(resp) if resp.status_code == 206 else 0
+                if total_size > RANGED_DOWNLOAD_MIN_SIZE:
+                    completed = self.download_ranged(url, total_size)
+                else:
+                    resp = self.session.get(url, stream=True, timeout=DOWNLOAD_TIMEOUT)
+                    resp.raise_for_status()
+                    completed = self.download_single(
+                        resp, int(resp.headers.get("content-length", 0))
+                    )
+            else:
+                resp.raise_for_status()
+                completed = self.download_single(
+                    resp, int(resp.headers.get("content-length", 0))
+                )
+            if not completed:
+                return
+
+            self.signals.progress_update.emit(self.row, 100)
+            self.signals.status_update.emit(self.row, "Completed")
+        except Exception:
+            if not self.cancel_event.is_set():
+                self.signals.status_update.emit(self.row, "Error")
+        finally:
+            self.signals.finished.emit(self.row)
 
-            total_size = int(resp.headers.get("content-length", 0))
-            downloaded_size = 0
+    @staticmethod
+    def ranged_total_size(resp):
+        """
+        Return the full file size from a 206 reply's Content-Range, or 0 if it
+        can't be used for ranged downloading.
+        """
+        # content-length of an encoded body isn't the file size
+        if resp.headers.get("content-encoding"):
+            return 0
+        match = _CONTENT_RANGE_RE.match(resp.headers.get("content-range", ""))
+        return int(match.group(3)) if match else 0
 
+    def download_single(self, resp, total_size):
+        """
+        Stream the whole file over one connection.
+        Return False if the job was stopped before it finished.
+        """
+        downloaded_size = 0
+        with open(self.save_path, "wb") as f:
+            # An encoded body's content-length isn't the size we'll write
+            if total_size and not resp.headers.get("content-encoding"):
+                preallocate(f, total_size)
+            try:
+                for chunk in resp.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    if self.cancel_event.is_set():
+                        return False
+                    f.write(chunk)
+                    downloaded_size += len(chunk)
+                    if total_size:
+                        self.emit_progress(int(downloaded_size * 100 / total_size))
+            finally:
+                # Drop any preallocated tail we never wrote, so a short or
+                # paused download doesn't look like a full-size file
+                f.truncate(downloaded_size)
+        return True
+
+    def download_ranged(self, url, total_size):
+        """
+        Split the file at `url` into RANGED_DOWNLOAD_SEGMENTS byte ranges, fetch
+        them in parallel and write each one at its own offset in the pre-sized file.
+        Return False if the job was stopped before it finished; a stopped or
+        failed download removes the partial file.
+        """
+        completed = False
+        try:
             with open(self.save_path, "wb") as f:
-                for chunk in resp.iter_content(chunk_size=8192):
-                    if not self.running:
-                        self.status_update.emit(self.row, "Paused")
-                        return
-                    if chunk:
+                preallocate(f, total_size)
+            completed = self.fetch_ranges(url, total_size)
+            return completed
+        finally:
+            if not completed:
+                # Segments aren't contiguous, so a partial file has zero-filled
+                # gaps and can't be trimmed into something valid; remove it
+                try:
+                    os.remove(self.save_path)
+                except OSError:
+                    pass
+
+    def fetch_ranges(self, url, total_size):
+        """
+        Fetch the byte ranges of download_ranged() into the pre-sized file.
+        Return False if the job was stopped before it finished.
+        """
+        segment_size = -(-total_size // RANGED_DOWNLOAD_SEGMENTS)
+        ranges = [
+            (lo, min(lo + segment_size, total_size) - 1)
+            for lo in range(0, total_size, segment_size)
+        ]
+
+        downloaded = [0]
+        lock = threading.Lock()
+        # Lets the other segments give up as soon as one of them fails
+        failed = threading.Event()
+
+        def fetch_range(lo, hi):
+            try:
+                resp = self.session.get(
+                    url,
+                    headers={"Range": f"bytes={lo}-{hi}"},
+                    stream=True,
+                    timeout=DOWNLOAD_TIMEOUT,
+                )
+                resp.raise_for_status()
+                if resp.status_code != 206:
+                    raise requests.exceptions.HTTPError(
+                        f"Range request ignored (HTTP {resp.status_code})"
+                    )
+                match = _CONTENT_RANGE_RE.match(resp.headers.get("content-range", ""))
+                if not match or tuple(map(int, match.groups())) != (lo, hi, total_size):
+                    raise requests.exceptions.HTTPError(
+                        f"Unexpected Content-Range for bytes {lo}-{hi}: "
+                        f"{resp.headers.get('content-range')!r}"
+                    )
+                written = 0
+                # A file object per segment keeps seek+write portable (no os.pwrite on Windows)
+                with open(self.save_path, "r+b") as f:
+                    f.seek(lo)
+                    for chunk in resp.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        if self.cancel_event.is_set() or failed.is_set():
+                            return
                         f.write(chunk)
-                        downloaded_size += len(chunk)
-                        if total_size:
-                            progress = int(downloaded_size / total_size * 100)
-                        else:
-                            progress = 0
-                        self.progress_update.emit(self.row, progress)
-
-            self.status_update.emit(self.row, "Completed")
-        except Exception:
-            self.status_update.emit(self.row, "Error")
+                        written += len(chunk)
+                        with lock:
+                            downloaded[0] += len(chunk)
+                            self.emit_progress(int(downloaded[0] * 100 / total_size))
+                # A short segment would leave a zero-filled hole in the file
+                if written != hi - lo + 1:
+                    raise IOError(f"Range {lo}-{hi} ended after {written} bytes")
+            except Exception:
+                failed.set()
+                raise
+
+        with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+            futures = [executor.submit(fetch_range, lo, hi) for lo, hi in ranges]
+        for future in futures:
+            future.result()
+
+        if self.cancel_event.is_set():
+            return False
+        if downloaded[0] != total_size:
+            raise IOError(f"Got {downloaded[0]} of {total_size} bytes")
+        return True
+
+    def emit_progress(self, progress):
+        # Only signal the GUI when the percentage moved and enough time passed,
+        # otherwise large files flood the event loop with queued updates
+        now = time.monotonic()
+        if progress == self._last_emit_pct or now - self._last_emit_time < PROGRESS_EMIT_INTERVAL:
+            return
+        self._last_emit_pct = progress
+        self._last_emit_time = now
+        self.signals.progress_update.emit(self.row, progress)
 
     def stop(self):
-        self.running = False
+        self.cancel_event.set()
+
+class ScrapeSignals(QObject):
+    finished = pyqtSignal(object)            # (the ScrapeJob)
+
+class ScrapeJob(QRunnable):
+    """
+    Fetch and parse a page off the GUI thread. When done, `pairs` holds the
+    scraped (link, title) list, or `error` the reason the fetch failed.
+    """
+    def __init__(self, url, session, page_cache):
+        super().__init__()
+        self.url = url
+        self.session = session
+        self.page_cache = page_cache
+        self.signals = ScrapeSignals()
+        self.pairs = []
+        self.error = None
+
+    def run(self):
+        try:
+            self.pairs = scrape_audio_links(self.session, self.url, self.page_cache)
+        except requests.exceptions.RequestException as e:
+            self.error = str(e)
+        finally:
+            self.signals.finished.emit(self)
+
+class DownloadModel(QAbstractTableModel):
+    """
+    Table rows kept as parallel lists (one per field) rather than one item
+    object per cell. Columns: File Name, Status, Progress; the Progress
+    column exposes its percentage through UserRole for ProgressDelegate.
+    """
+    HEADERS = ["File Name", "Status", "Progress"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.names = []
+        self.statuses = []
+        self.progress = []
+        self.urls = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.names)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            if col == 0:
+                return self.names[row]
+            if col == 1:
+                return self.statuses[row]
+        elif role == Qt.ItemDataRole.UserRole and col == 2:
+            return self.progress[row]
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if not index.isValid():
+            return False
+        row, col = index.row(), index.column()
+        # Name and status are shown as well as edited, so both roles change
+        text_roles = [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole]
+        if role == Qt.ItemDataRole.EditRole and col == 0:
+            self.names[row] = value
+            changed = text_roles
+        elif role == Qt.ItemDataRole.EditRole and col == 1:
+            self.statuses[row] = value
+            changed = text_roles
+        elif role == Qt.ItemDataRole.UserRole and col == 2:
+            self.progress[row] = value
+            changed = [role]
+        else:
+            return False
+        self.dataChanged.emit(index, index, changed)
+        return True
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index):
+        flags = super().flags(index)
+        # File names can be edited; the edited name is used when saving
+        if index.column() == 0:
+            flags |= Qt.ItemFlag.ItemIsEditable
+        return flags
+
+    def append_rows(self, pairs):
+        """Append (link, title) pairs as new Pending rows in one insert."""
+        base = len(self.names)
+        self.beginInsertRows(QModelIndex(), base, base + len(pairs) - 1)
+        for (link, track_title) in pairs:
+            self.names.append(track_title)
+            self.statuses.append("Pending")
+            self.progress.append(0)
+            self.urls.append(link)
+        self.endInsertRows()
+
+    def set_status(self, row, status):
+        self.setData(self.index(row, 1), status)
+
+    def set_progress(self, row, progress):
+        self.setData(self.index(row, 2), progress, Qt.ItemDataRole.UserRole)
+
+class ProgressDelegate(QStyledItemDelegate):
+    """
+    Paint the Progress column as a progress bar from the percentage the model
+    returns for UserRole, instead of keeping a QProgressBar widget per row.
+    """
+    def paint(self, painter, option, index):
+        progress = index.data(Qt.ItemDataRole.UserRole) or 0
+
+        bar = QStyleOptionProgressBar()
+        bar.rect = option.rect
+        bar.state = option.state | QStyle.StateFlag.State_Horizontal
+        bar.minimum = 0
+        bar.maximum = 100
+        bar.progress = progress
+        bar.text = f"{progress}%"
+        bar.textVisible = True
+
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawControl(QStyle.ControlElement.CE_ProgressBar, bar, painter)
 
 class DownloaderApp(QWidget):
     def __init__(self):
@@ -92,12 +521,37 @@ class DownloaderApp(QWidget):
         # Data
         self.save_directory = os.getcwd()
         self.known_links = set()
-
-        # Concurrency
-        self.download_threads = {}
-        self.download_queue = deque()
-        self.active_downloads = 0
+        # url -> (etag, last_modified, parsed_pairs) for conditional GETs
+        self._page_cache = {}
+        # url -> {"ts": monotonic time, "data": parsed_pairs}, reused for SCRAPE_CACHE_TTL
+        self._scrape_cache = {}
+
+        # One shared session so page refreshes and downloads reuse
+        # keep-alive connections instead of a new TCP+TLS handshake each time
+        self.session = requests.Session()
+        # Sized so every ranged segment of every concurrent job, plus the page
+        # scraper, can hold its own pooled connection
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=MAX_CONCURRENT_DOWNLOADS * RANGED_DOWNLOAD_SEGMENTS + 1,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # Concurrency: the pool queues jobs and runs at most max_concurrent_downloads
+        self.download_jobs = {}
+        # Paused/cancelled jobs still running, keyed by their signals object;
+        # held so the runnable isn't destroyed before it emits finished
+        self._stopping = {}
         self.max_concurrent_downloads = 2
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(self.max_concurrent_downloads)
+
+        # Page scraping runs on its own single-thread pool so it never waits
+        # behind downloads; in-flight jobs map to the slot that takes their links
+        self.scrape_pool = QThreadPool(self)
+        self.scrape_pool.setMaxThreadCount(1)
+        self._scrape_jobs = {}
 
         # Keep Loading / Timed Refresh
         self.keep_loading = False
@@ -151,7 +605,7 @@ class DownloaderApp(QWidget):
         concurrency_layout.addWidget(QLabel("Max Concurrency:"))
 
         self.concurrency_spin = QSpinBox()
-        self.concurrency_spin.setRange(1, 50)
+        self.concurrency_spin.setRange(1, MAX_CONCURRENT_DOWNLOADS)
         self.concurrency_spin.setValue(self.max_concurrent_downloads)
         self.concurrency_spin.valueChanged.connect(self.on_concurrency_changed)
         concurrency_layout.addWidget(self.concurrency_spin)
@@ -164,13 +618,14 @@ class DownloaderApp(QWidget):
         main_layout.addLayout(concurrency_layout)
 
         # -- Row 5: Table
-        self.table = QTableWidget()
-        self.table.setColumnCount(3)
-        self.table.setHorizontalHeaderLabels(["File Name", "Status", "Progress"])
+        self.model = DownloadModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         # Let user drag columns left/right
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
         # Enable word wrap in table cells
         self.table.setWordWrap(True)
+        self.table.setItemDelegateForColumn(2, ProgressDelegate(self.table))
 
         self.table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.table.customContextMenuRequested.connect(self.show_context_menu)
@@ -188,19 +643,14 @@ class DownloaderApp(QWidget):
             return
 
         self.folder_label.setText("Fetching links...")
-        QApplication.processEvents()
+        self.start_scrape(url, self.on_links_fetched, force=True)
 
-        new_links = self.scrape_audio_links(url)
+    def on_links_fetched(self, new_links):
         if not new_links:
             self.folder_label.setText("No audio links found.")
             return
 
-        added_count = 0
-        for (link, track_title) in new_links:
-            if link not in self.known_links:
-                self.known_links.add(link)
-                self.add_link_to_table(link, track_title)
-                added_count += 1
+        added_count = self.add_links_batch(new_links)
 
         self.folder_label.setText(
             f"Found: {len(new_links)} audio links. {added_count} new."
@@ -208,73 +658,51 @@ class DownloaderApp(QWidget):
         self.start_download_button.setEnabled(True)
         self.start_timed_loading_button.setEnabled(True)
 
-    def scrape_audio_links(self, url):
+    def start_scrape(self, url, on_done, force=False):
         """
-        Return a list of (absolute_url, final_title).
-        final_title is the anchor text if available, else fallback to basename.
-        Then we strip the trailing 'download' from .mp3download, .flacdownload, etc.
-        And we pass the result through 'sanitize_title()' (which does Title Case).
+        Scrape `url` in the background and pass the (link, title) list to
+        on_done. A result for the same URL less than SCRAPE_CACHE_TTL seconds
+        old is handed over straight away instead.
+        force=True (a manual "Fetch Links") always goes to the network.
         """
-        try:
-            resp = requests.get(url, timeout=10)
-            resp.raise_for_status()
-        except requests.exceptions.RequestException as e:
-            self.folder_label.setText(f"Error fetching URL: {e}")
-            return []
-
-        soup = BeautifulSoup(resp.text, "html.parser")
-        base_url = url.rsplit("/", 1)[0]
-
-        found = []
-        for a in soup.find_all("a", href=True):
-            href = a["href"]
-            absolute_url = urljoin(base_url, href)
-            lower = absolute_url.lower()
-
-            # Filter out only known audio
-            # We'll consider either the normal .mp3 or the .mp3download etc.
-            if any(
-                lower.endswith(ext)
-                or any(lower.endswith(dl) for dl in DOWNLOAD_SUFFIX_MAP.keys())
-                for ext in AUDIO_EXTENSIONS
-            ):
-                anchor_text = a.get_text(strip=True)
-                anchor_text = unquote(anchor_text)
-                if anchor_text:
-                    raw_title = anchor_text
-                else:
-                    raw_title = os.path.basename(urllib.parse.urlparse(absolute_url).path)
-                    raw_title = unquote(raw_title)
-
-                if not raw_title:
-                    raw_title = "unnamed_file"
-
-                # If the extension ends with .mp3download or .flacdownload, fix it:
-                for dl_suffix, real_ext in DOWNLOAD_SUFFIX_MAP.items():
-                    if raw_title.lower().endswith(dl_suffix):
-                        raw_title = raw_title[: -len(dl_suffix)] + real_ext
-                        break
-
-                final_title = sanitize_title(raw_title)
-                found.append((absolute_url, final_title))
-
-        return found
+        entry = self._scrape_cache.get(url)
+        if not force and entry and time.monotonic() - entry["ts"] < SCRAPE_CACHE_TTL:
+            on_done(entry["data"])
+            return
 
-    def add_link_to_table(self, link, track_title):
-        row = self.table.rowCount()
-        self.table.insertRow(row)
+        job = ScrapeJob(url, self.session, self._page_cache)
+        job.setAutoDelete(False)
+        job.signals.finished.connect(self.on_scrape_finished)
+        self._scrape_jobs[job] = on_done
+        self.scrape_pool.start(job)
 
-        name_item = QTableWidgetItem(track_title)
-        self.table.setItem(row, 0, name_item)
+    def on_scrape_finished(self, job):
+        on_done = self._scrape_jobs.pop(job)
+        if job.error is not None:
+            self.folder_label.setText(f"Error fetching URL: {job.error}")
+            return
 
-        status_item = QTableWidgetItem("Pending")
-        # store the link in user data
-        status_item.setData(Qt.ItemDataRole.UserRole, link)
-        self.table.setItem(row, 1, status_item)
+        # Empty results may be a parse failure; don't let them hide the next try
+        if job.pairs:
+            self._scrape_cache[job.url] = {"ts": time.monotonic(), "data": job.pairs}
+        else:
+            self._scrape_cache.pop(job.url, None)
+        on_done(job.pairs)
 
-        progress_bar = QProgressBar()
-        progress_bar.setValue(0)
-        self.table.setCellWidget(row, 2, progress_bar)
+    def add_links_batch(self, pairs):
+        """
+        Append every (link, title) not seen before to the table in one
+        model insert, so a big page doesn't relayout per row.
+        Return how many rows were added.
+        """
+        new_rows = []
+        for (link, track_title) in pairs:
+            if link not in self.known_links:
+                self.known_links.add(link)
+                new_rows.append((link, track_title))
+        if new_rows:
+            self.model.append_rows(new_rows)
+        return len(new_rows)
 
     # ------------------------------------------------
     # 2) Keep Loading / Timed Refresh
@@ -309,13 +737,13 @@ class DownloaderApp(QWidget):
         if not url:
             return
 
-        new_pairs = self.scrape_audio_links(url)
-        added_count = 0
-        for (link, track_title) in new_pairs:
-            if link not in self.known_links:
-                self.known_links.add(link)
-                self.add_link_to_table(link, track_title)
-                added_count += 1
+        # Slow pages can take longer than the interval; don't stack requests
+        if self._scrape_jobs:
+            return
+        self.start_scrape(url, self.on_links_refreshed)
+
+    def on_links_refreshed(self, new_pairs):
+        added_count = self.add_links_batch(new_pairs)
 
         if added_count > 0:
             self.folder_label.setText(f"Added {added_count} new links.")
@@ -327,56 +755,53 @@ class DownloaderApp(QWidget):
     # ------------------------------------------------
     def on_concurrency_changed(self, value):
         self.max_concurrent_downloads = value
+        self.pool.setMaxThreadCount(value)
 
     def queue_downloads_from_top(self):
-        self.download_queue.clear()
-        for row in range(self.table.rowCount()):
-            status_item = self.table.item(row, 1)
-            if status_item and status_item.text() == "Pending":
-                status_item.setText("Queued")
-                self.download_queue.append(row)
-        self.check_download_queue()
-
-    def check_download_queue(self):
-        while self.active_downloads < self.max_concurrent_downloads and self.download_queue:
-            row = self.download_queue.popleft()
-            self.start_download(row)
-
-    def start_download(self, row):
-        if row in self.download_threads:
-            return
+        for row, status in enumerate(self.model.statuses):
+            if status == "Pending":
+                self.model.set_status(row, "Queued")
+                self.start_download(row)
 
-        status_item = self.table.item(row, 1)
-        if not status_item:
+    def start_download(self, row, priority=0):
+        job = self.download_jobs.get(row)
+        if job:
+            # Already queued or running; re-submit a still-queued job so a
+            # higher priority moves it to the front of the pool's queue
+            if priority and self.pool.tryTake(job):
+                self.pool.start(job, priority)
             return
 
-        link = status_item.data(Qt.ItemDataRole.UserRole)
+        link = self.model.urls[row]
         if not link:
             return
 
-        filename = self.table.item(row, 0).text()
-        save_path = os.path.join(self.save_directory, filename)
+        job = DownloadJob(row, link, self.session, self.save_path_for)
+        job.setAutoDelete(False)
+        job.signals.progress_update.connect(self.update_progress)
+        job.signals.status_update.connect(self.handle_status_update)
+        job.signals.finished.connect(self.on_download_finished)
+        self.download_jobs[row] = job
 
-        thread = DownloadThread(row, link, save_path)
-        thread.progress_update.connect(self.update_progress)
-        thread.status_update.connect(self.handle_status_update)
-        self.download_threads[row] = thread
+        self.pool.start(job, priority)
 
-        self.active_downloads += 1
-        thread.start()
+    def save_path_for(self, row):
+        return os.path.join(self.save_directory, self.model.names[row])
 
     def update_progress(self, row, progress):
-        progress_bar = self.table.cellWidget(row, 2)
-        if progress_bar:
-            progress_bar.setValue(progress)
+        self.model.set_progress(row, progress)
 
     def handle_status_update(self, row, status):
-        self.table.setItem(row, 1, QTableWidgetItem(status))
-        if status in ("Completed", "Error", "Cancelled"):
-            self.active_downloads -= 1
-            if row in self.download_threads:
-                del self.download_threads[row]
-            self.check_download_queue()
+        self.model.set_status(row, status)
+
+    def on_download_finished(self, row):
+        # A paused row may have been restarted before its old job wound down;
+        # only forget the job if it is the one that just finished
+        signals = self.sender()
+        job = self.download_jobs.get(row)
+        if job and job.signals is signals:
+            del self.download_jobs[row]
+        self._stopping.pop(signals, None)
 
     # ------------------------------------------------
     # 4) Folder selection
@@ -402,12 +827,10 @@ class DownloaderApp(QWidget):
 
         action = menu.exec(self.table.viewport().mapToGlobal(position))
         if action == download_action:
-            status_item = self.table.item(row, 1)
-            if status_item and status_item.text() in ("Pending", "Queued", "Error"):
-                status_item.setText("Queued")
-                if row not in self.download_queue:
-                    self.download_queue.appendleft(row)
-                self.check_download_queue()
+            if self.model.statuses[row] in ("Pending", "Queued", "Error"):
+                self.model.set_status(row, "Queued")
+                # Jump ahead of rows queued by "Start Download"
+                self.start_download(row, priority=1)
             else:
                 self.start_download(row)
         elif action == pause_action:
@@ -418,34 +841,48 @@ class DownloaderApp(QWidget):
     # ------------------------------------------------
     # 6) Pause / Cancel
     # ------------------------------------------------
+    def stop_job(self, row):
+        """
+        Stop the row's job: drop it from the pool's queue if it has not
+        started yet, otherwise ask the running job to stop.
+        Return the stopped job, or None if the row had none.
+        """
+        job = self.download_jobs.pop(row, None)
+        if not job:
+            return None
+        job.stop()
+        if not self.pool.tryTake(job):
+            # Already running: keep it alive until its finished signal arrives
+            self._stopping[job.signals] = job
+        return job
+
     def pause_download(self, row):
-        thread = self.download_threads.get(row)
-        if thread:
-            thread.stop()
-            self.table.setItem(row, 1, QTableWidgetItem("Paused"))
-            self.active_downloads -= 1
-            del self.download_threads[row]
-            self.check_download_queue()
+        if self.stop_job(row):
+            self.handle_status_update(row, "Paused")
 
     def cancel_download(self, row):
-        thread = self.download_threads.get(row)
-        if thread:
-            thread.stop()
-            file_name = self.table.item(row, 0).text()
-            save_path = os.path.join(self.save_directory, file_name)
+        job = self.stop_job(row)
+        # save_path is only set once the job started writing
+        if job and job.save_path:
+            save_path = job.save_path
             if os.path.exists(save_path):
                 try:
                     os.remove(save_path)
                 except Exception as e:
                     print("Error removing file:", e)
-            self.table.setItem(row, 1, QTableWidgetItem("Cancelled"))
-            self.active_downloads -= 1
-            del self.download_threads[row]
-            self.check_download_queue()
-        else:
-            if row in self.download_queue:
-                self.download_queue.remove(row)
-            self.table.setItem(row, 1, QTableWidgetItem("Cancelled"))
+        self.handle_status_update(row, "Cancelled")
+
+    def closeEvent(self, event):
+        # Stop queued and running jobs so the pool does not block on exit;
+        # DOWNLOAD_TIMEOUT bounds how long a stalled read can hold it up
+        self.pool.clear()
+        for job in self.download_jobs.values():
+            job.stop()
+        self.pool.waitForDone()
+        self.scrape_pool.clear()
+        self.scrape_pool.waitForDone()
+        self.session.close()
+        super().closeEvent(event)
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)